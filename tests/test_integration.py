@@ -1,4 +1,6 @@
-import itertools
+import hashlib
+import json
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -21,28 +23,17 @@ from turftopic import (
 )
 
 
-def batched(iterable, n: int):
-    "Batch data into tuples of length n. The last batch may be shorter."
-    # batched('ABCDEFG', 3) --> ABC DEF G
-    if n < 1:
-        raise ValueError("n must be at least one")
-    it = iter(iterable)
-    while batch := list(itertools.islice(it, n)):
-        yield batch
-
-
 def generate_dates(
     n_dates: int,
 ) -> list[datetime]:
     """Generate random dates to test dynamic models"""
-    dates = []
-    for n in range(n_dates):
-        d = np.random.randint(low=1, high=29)
-        m = np.random.randint(low=1, high=13)
-        y = np.random.randint(low=2000, high=2020)
-        date = datetime(year=y, month=m, day=d)
-        dates.append(date)
-    return dates
+    days = np.random.randint(low=1, high=29, size=n_dates)
+    months = np.random.randint(low=1, high=13, size=n_dates)
+    years = np.random.randint(low=2000, high=2020, size=n_dates)
+    return [
+        datetime(year=int(y), month=int(m), day=int(d))
+        for y, m, d in zip(years, months, days)
+    ]
 
 
 newsgroups = fetch_20newsgroups(
@@ -53,8 +44,32 @@ newsgroups = fetch_20newsgroups(
     remove=("headers", "footers", "quotes"),
 )
 texts = newsgroups.data
-trf = SentenceTransformer("all-MiniLM-L6-v2")
-embeddings = np.asarray(trf.encode(texts))
+encoder_name = "all-MiniLM-L6-v2"
+trf = SentenceTransformer(encoder_name)
+# Embeddings are cached on disk so that test sessions can skip encoding
+corpus_hash = hashlib.sha1(
+    "\n".join([encoder_name, *texts]).encode()
+).hexdigest()[:12]
+embedding_cache = Path(tempfile.gettempdir()).joinpath(
+    f"turftopic_test_embeddings_{corpus_hash}.npy"
+)
+try:
+    embeddings = np.load(embedding_cache)
+except (OSError, ValueError, EOFError):
+    # The cache is missing or unreadable, so the corpus gets re-encoded
+    embeddings = trf.encode(
+        texts, convert_to_numpy=True, show_progress_bar=False
+    )
+    # Saving to a temporary file first, so that interrupted or concurrent
+    # sessions can't leave a truncated file behind
+    fd, tmp_path = tempfile.mkstemp(
+        dir=embedding_cache.parent, suffix=".npy.tmp"
+    )
+    with os.fdopen(fd, "wb") as tmp_file:
+        np.save(tmp_file, embeddings)
+    os.replace(tmp_path, embedding_cache)
+# Keeping embeddings in float32 so that estimators don't upcast them
+embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
 timestamps = generate_dates(n_dates=len(texts))
 
 models = [
@@ -119,10 +134,9 @@ def test_fit_dynamic(model):
 @pytest.mark.parametrize("model", online_models)
 def test_fit_online(model):
     for epoch in range(5):
-        for batch in batched(zip(texts, embeddings), 50):
-            batch_text, batch_embedding = zip(*batch)
-            batch_text = list(batch_text)
-            batch_embedding = np.stack(batch_embedding)
+        for start in range(0, len(texts), 50):
+            batch_text = texts[start : start + 50]
+            batch_embedding = embeddings[start : start + 50]
             model.partial_fit(batch_text, embeddings=batch_embedding)
     table = model.export_topics(format="csv")
     with tempfile.TemporaryDirectory() as tmpdirname:
@@ -154,3 +168,108 @@ def test_hierarchical():
     model.hierarchy.divide_children(3)
     model.hierarchy[0][0].divide(3)
     repr = str(model.hierarchy)
+
+
+def test_embedding_cache():
+    corpus = texts[:100]
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        model = GMM(3, encoder=trf, cache_dir=tmpdirname)
+        model.fit(corpus)
+        cache_files = list(Path(tmpdirname).rglob("*.npy"))
+        assert len(cache_files) == len(set(corpus))
+        # A new model has nothing in memory, so it reads from disk
+        new_model = GMM(3, encoder=trf, cache_dir=tmpdirname)
+        cached_embeddings = new_model.encode_documents(corpus)
+        expected = trf.encode(corpus, convert_to_numpy=True)
+        assert cached_embeddings.dtype == np.float32
+        assert np.allclose(cached_embeddings, expected, atol=1e-5)
+
+
+def test_prepare_topic_data_reuses_fit():
+    model = GMM(3, encoder=trf)
+    doc_topic_matrix = model.fit_transform(texts, embeddings=embeddings)
+    topic_data = model.prepare_topic_data(texts, embeddings=embeddings)
+    assert topic_data["document_topic_matrix"] is doc_topic_matrix
+
+
+def test_prepare_topic_data_after_refit():
+    model = ClusteringTopicModel(
+        dimensionality_reduction=PCA(10),
+        clustering=KMeans(3),
+        encoder=trf,
+    )
+    model.fit_transform(texts, embeddings=embeddings)
+    # Refitting through a method other than fit_transform
+    model.clustering = KMeans(5)
+    model.fit_predict(texts[:500], embeddings=embeddings[:500])
+    topic_data = model.prepare_topic_data(texts, embeddings=embeddings)
+    n_topics, n_vocab = topic_data["topic_term_matrix"].shape
+    assert topic_data["document_topic_matrix"].shape == (len(texts), n_topics)
+    assert topic_data["document_term_matrix"].shape == (len(texts), n_vocab)
+
+
+def test_get_topics_after_components_change():
+    model = GMM(3, encoder=trf).fit(texts, embeddings=embeddings)
+    model.get_topics()
+    # Cached top terms have to be recomputed for the new components
+    model.components_ = -model.components_
+    vocab = model.get_vocab()
+    for (_, top_words), components in zip(
+        model.get_topics(top_k=1), model.components_
+    ):
+        assert top_words[0][0] == vocab[np.argmax(components)]
+
+
+def test_prepare_topic_data_reuses_document_terms():
+    model = GMM(3, encoder=trf).fit(texts, embeddings=embeddings)
+    corpus = texts[:100]
+    first = model.prepare_topic_data(corpus, embeddings=embeddings[:100])
+    second = model.prepare_topic_data(corpus, embeddings=embeddings[:100])
+    assert second["document_term_matrix"] is first["document_term_matrix"]
+    expected = model.vectorizer.transform(corpus)
+    assert (first["document_term_matrix"] != expected).nnz == 0
+    # A refitted vectorizer invalidates the stored matrix
+    model.vectorizer.fit(corpus)
+    third = model.prepare_topic_data(corpus, embeddings=embeddings[:100])
+    assert third["document_term_matrix"] is not first["document_term_matrix"]
+    assert third["document_term_matrix"].shape[1] == len(
+        model.vectorizer.vocabulary_
+    )
+
+
+def test_representative_documents_topic_ids():
+    model = ClusteringTopicModel(
+        dimensionality_reduction=PCA(10),
+        clustering=KMeans(3),
+        encoder=trf,
+    )
+    doc_topic_matrix = model.fit_transform(texts, embeddings=embeddings)
+    topic_id = model.classes_[-1]
+    table = model.export_representative_documents(
+        topic_id, texts, document_topic_matrix=doc_topic_matrix
+    )
+    assert table.startswith('"Document","Score"')
+    with pytest.raises(ValueError):
+        model.export_representative_documents(
+            max(model.classes_) + 1,
+            texts,
+            document_topic_matrix=doc_topic_matrix,
+        )
+    # Topic indices have to be looked up again when classes change
+    model.classes_ = model.classes_ + 10
+    model.export_representative_documents(
+        topic_id + 10, texts, document_topic_matrix=doc_topic_matrix
+    )
+    with pytest.raises(ValueError):
+        model.export_representative_documents(
+            topic_id, texts, document_topic_matrix=doc_topic_matrix
+        )
+
+
+def test_get_topics_json_serializable():
+    model = GMM(3, encoder=trf).fit(texts, embeddings=embeddings)
+    topics = model.get_topics()
+    for _, top_words in topics:
+        for _, score in top_words:
+            assert type(score) is float
+    json.dumps(topics)
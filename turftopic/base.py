@@ -1,20 +1,45 @@
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Optional, Tuple, Union
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
+import scipy.sparse as spr
+import torch
 from rich.console import Console
 from rich.table import Table
 from sentence_transformers import SentenceTransformer
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.exceptions import NotFittedError
 
+from turftopic.cache import EmbeddingCache
 from turftopic.data import TopicData
 from turftopic.encoders import ExternalEncoder
 from turftopic.utils import export_table
 
+_WHITESPACE = re.compile(r"\s+")
+
+# Spinning up worker processes only pays off for larger corpora.
+MULTI_PROCESS_THRESHOLD = 5000
+
+precision_message = (
+    "Precision not supported for encoding, please use 'fp32' or 'fp16'."
+)
+
 
 def remove_whitespace(text: str) -> str:
-    return " ".join(text.strip().split())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+_format_term = "{}({:.2f})".format
+
+
+def _concat_terms(
+    words: Iterable[str], scores: Iterable[float], show_scores: bool
+) -> str:
+    """Joins terms into a comma separated string for topic tables."""
+    if show_scores:
+        return ", ".join(map(_format_term, words, scores))
+    return ", ".join(words)
 
 
 Encoder = Union[ExternalEncoder, SentenceTransformer]
@@ -23,6 +48,71 @@ Encoder = Union[ExternalEncoder, SentenceTransformer]
 class ContextualModel(ABC, TransformerMixin, BaseEstimator):
     """Base class for contextual topic models in Turftopic."""
 
+    def __setattr__(self, name: str, value: Any):
+        # Top terms and topic indices are cached, and have to be recomputed
+        # whenever the model gets new components or classes.
+        if name == "components_":
+            self.__dict__.pop("_top_terms_cache", None)
+            # Results of an earlier fit are no longer valid either,
+            # fitting methods remember them after setting components_.
+            self.__dict__.pop("_last_fit", None)
+            self.__dict__.pop("_last_document_terms", None)
+            # Components are stored in float32 and C order,
+            # as top terms get extracted from them row by row.
+            if value is not None:
+                value = np.ascontiguousarray(value, dtype=np.float32)
+        if name == "classes_":
+            self.__dict__.pop("_class_index_cache", None)
+        super().__setattr__(name, value)
+
+    @property
+    def _class_to_index(self) -> dict:
+        """Mapping of topic IDs to their index in the model's components."""
+        if "_class_index_cache" not in self.__dict__:
+            self.__dict__["_class_index_cache"] = {
+                topic_id: i_topic
+                for i_topic, topic_id in enumerate(self.classes_)
+            }
+        return self.__dict__["_class_index_cache"]
+
+    def _top_terms(
+        self, top_k: int, lowest: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns indices and importances of the top K terms in each topic,
+        sorted by importance. Results are cached until components_ changes.
+        If lowest is True, the lowest ranking terms are returned instead.
+        """
+        cache = self.__dict__.setdefault("_top_terms_cache", {})
+        if (top_k, lowest) not in cache:
+            components = self.components_
+            n_vocab = components.shape[1]
+            kth = min(top_k, n_vocab)
+            if lowest:
+                terms = np.argpartition(
+                    components, min(kth, n_vocab - 1), axis=1
+                )[:, :kth]
+            else:
+                terms = np.argpartition(components, -kth, axis=1)[
+                    :, n_vocab - kth :
+                ]
+            scores = np.take_along_axis(components, terms, axis=1)
+            order = np.argsort(scores if lowest else -scores, axis=1)
+            cache[(top_k, lowest)] = (
+                np.take_along_axis(terms, order, axis=1),
+                np.take_along_axis(scores, order, axis=1),
+            )
+        return cache[(top_k, lowest)]
+
+    def _get_topics_arrays(
+        self, top_k: int = 10, lowest: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the top K words in each topic and their importances
+        as two arrays of shape (n_topics, top_k).
+        If lowest is True, the lowest ranking words are returned instead.
+        """
+        terms, scores = self._top_terms(top_k, lowest)
+        return self.get_vocab()[terms], scores
+
     def get_topics(
         self, top_k: int = 10
     ) -> List[Tuple[Any, List[Tuple[str, float]]]]:
@@ -44,66 +134,46 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
             classes = self.classes_
         except AttributeError:
             classes = list(range(n_topics))
-        highest = np.argpartition(-self.components_, top_k)[:, :top_k]
-        vocab = self.get_vocab()
-        top = []
-        score = []
-        for component, high in zip(self.components_, highest):
-            importance = component[high]
-            high = high[np.argsort(-importance)]
-            score.append(component[high])
-            top.append(vocab[high])
-        topics = []
-        for topic, words, scores in zip(classes, top, score):
-            topic_data = (topic, list(zip(words, scores)))
-            topics.append(topic_data)
-        return topics
+        top_words, top_scores = self._get_topics_arrays(top_k)
+        # Scores are returned as Python floats,
+        # as components are stored in float32 internally.
+        return [
+            (topic, list(zip(words, scores.tolist())))
+            for topic, words, scores in zip(classes, top_words, top_scores)
+        ]
 
     def _topics_table(
         self,
         top_k: int = 10,
         show_scores: bool = False,
         show_negative: bool = False,
-    ) -> list[list[str]]:
+    ) -> Iterator[list[str]]:
+        """Yields rows of the topic table, starting with the column names."""
         columns = ["Topic ID", "Highest Ranking"]
         if show_negative:
             columns.append("Lowest Ranking")
-        rows = []
+        yield columns
         try:
             classes = self.classes_
         except AttributeError:
             classes = list(range(self.components_.shape[0]))
-        vocab = self.get_vocab()
-        for topic_id, component in zip(classes, self.components_):
-            highest = np.argpartition(-component, top_k)[:top_k]
-            highest = highest[np.argsort(-component[highest])]
-            lowest = np.argpartition(component, top_k)[:top_k]
-            lowest = lowest[np.argsort(component[lowest])]
-            if show_scores:
-                concat_positive = ", ".join(
-                    [
-                        f"{word}({importance:.2f})"
-                        for word, importance in zip(
-                            vocab[highest], component[highest]
-                        )
-                    ]
-                )
-                concat_negative = ", ".join(
-                    [
-                        f"{word}({importance:.2f})"
-                        for word, importance in zip(
-                            vocab[lowest], component[lowest]
-                        )
-                    ]
-                )
-            else:
-                concat_positive = ", ".join([word for word in vocab[highest]])
-                concat_negative = ", ".join([word for word in vocab[lowest]])
-            row = [f"{topic_id}", f"{concat_positive}"]
+        top_words, top_scores = self._get_topics_arrays(top_k)
+        if show_negative:
+            low_words, low_scores = self._get_topics_arrays(top_k, lowest=True)
+        for i_topic, topic_id in enumerate(classes):
+            row = [
+                f"{topic_id}",
+                _concat_terms(
+                    top_words[i_topic], top_scores[i_topic], show_scores
+                ),
+            ]
             if show_negative:
-                row.append(concat_negative)
-            rows.append(row)
-        return [columns, *rows]
+                row.append(
+                    _concat_terms(
+                        low_words[i_topic], low_scores[i_topic], show_scores
+                    )
+                )
+            yield row
 
     def print_topics(
         self,
@@ -179,26 +249,27 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
         show_negative: bool = False,
     ) -> list[list[str]]:
         if document_topic_matrix is None:
-            try:
-                document_topic_matrix = self.transform(raw_documents)
-            except AttributeError:
+            if not hasattr(self, "transform"):
                 raise ValueError(
                     "Transductive methods cannot "
                     "infer topical content in documents.\n"
                     "Please pass a document_topic_matrix."
                 )
-        try:
-            topic_id = list(self.classes_).index(topic_id)
-        except AttributeError:
-            pass
-        kth = min(top_k, document_topic_matrix.shape[0] - 1)
-        highest = np.argpartition(-document_topic_matrix[:, topic_id], kth)[
-            :kth
-        ]
-        highest = highest[
-            np.argsort(-document_topic_matrix[highest, topic_id])
-        ]
-        scores = document_topic_matrix[highest, topic_id]
+            document_topic_matrix = self.transform(raw_documents)
+        if hasattr(self, "classes_"):
+            if topic_id not in self._class_to_index:
+                raise ValueError(f"{topic_id} is not a valid topic ID.")
+            topic_id = self._class_to_index[topic_id]
+        if spr.issparse(document_topic_matrix):
+            topic_scores = document_topic_matrix[:, topic_id].toarray()
+        else:
+            topic_scores = document_topic_matrix[:, topic_id]
+        topic_scores = np.asarray(topic_scores).ravel()
+        n_documents = topic_scores.shape[0]
+        kth = min(top_k, n_documents - 1)
+        highest = np.argpartition(topic_scores, -kth)[n_documents - kth :]
+        highest = highest[np.argsort(-topic_scores[highest])]
+        scores = topic_scores[highest]
         columns = []
         columns.append("Document")
         columns.append("Score")
@@ -211,14 +282,10 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
             rows.append([doc, f"{score:.2f}"])
         if show_negative:
             rows.append(["...", ""])
-            lowest = np.argpartition(document_topic_matrix[:, topic_id], kth)[
-                :kth
-            ]
-            lowest = lowest[
-                np.argsort(document_topic_matrix[lowest, topic_id])
-            ]
+            lowest = np.argpartition(topic_scores, kth)[:kth]
+            lowest = lowest[np.argsort(topic_scores[lowest])]
             lowest = lowest[::-1]
-            scores = document_topic_matrix[lowest, topic_id]
+            scores = topic_scores[lowest]
             for document_id, score in zip(lowest, scores):
                 doc = raw_documents[document_id]
                 doc = remove_whitespace(doc)
@@ -296,7 +363,7 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
             Specifies which format should be used.
             'csv', 'latex' and 'markdown' are supported.
         """
-        table = self._highest_ranking_docs(
+        table = self._representative_docs(
             topic_id,
             raw_documents,
             document_topic_matrix,
@@ -308,12 +375,11 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
     @property
     def topic_names(self) -> list[str]:
         """Names of the topics based on the highest scoring 4 terms."""
-        topic_desc = self.get_topics(top_k=4)
-        names = []
-        for topic_id, terms in topic_desc:
-            concat_words = "_".join([word for word, importance in terms])
-            names.append(f"{topic_id}_{concat_words}")
-        return names
+        top_words, _ = self._get_topics_arrays(top_k=4)
+        return [
+            f"{topic_id}_" + "_".join(words)
+            for topic_id, words in zip(self.get_feature_names_out(), top_words)
+        ]
 
     def _topic_distribution(
         self, text=None, topic_dist=None, top_k: int = 10
@@ -323,20 +389,15 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
                 raise ValueError(
                     "You should either pass a text or a distribution."
                 )
-            try:
-                topic_dist = self.transform([text])
-            except AttributeError:
+            if not hasattr(self, "transform"):
                 raise ValueError(
                     "Transductive methods cannot "
                     "infer topical content in documents.\n"
                     "Please pass a topic distribution."
                 )
+            topic_dist = self.transform([text])
         topic_dist = np.squeeze(np.asarray(topic_dist))
-        topic_desc = self.get_topics(top_k=4)
-        topic_names = []
-        for topic_id, terms in topic_desc:
-            concat_words = "_".join([word for word, importance in terms])
-            topic_names.append(f"{topic_id}_{concat_words}")
+        topic_names = self.topic_names
         highest = np.argsort(-topic_dist)[:top_k]
         columns = []
         columns.append("Topic name")
@@ -407,7 +468,124 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
         ndarray of shape (n_documents, n_dimensions)
             Matrix of document embeddings.
         """
-        return self.encoder_.encode(raw_documents)
+        raw_documents = list(raw_documents)
+        if not raw_documents:
+            return self.encoder_.encode(raw_documents)
+        # Precision has to be set before the cache is looked up,
+        # as the dtype of the encoder is part of its namespace.
+        self._set_encoder_precision()
+        cache = self._get_embedding_cache()
+        if cache is None:
+            return np.asarray(self._encode(raw_documents), dtype=np.float32)
+        keys = [cache.key(doc) for doc in raw_documents]
+        cached = [cache.get(key) for key in keys]
+        missing = [i for i, emb in enumerate(cached) if emb is None]
+        if missing:
+            new_embeddings = self._encode([raw_documents[i] for i in missing])
+            for i, embedding in zip(missing, new_embeddings):
+                cached[i] = cache.set(keys[i], embedding)
+        return np.stack(cached).astype(np.float32, copy=False)
+
+    def _encode(self, documents: list[str]) -> np.ndarray:
+        """Runs the encoder on the documents.
+        Large corpora get encoded in multiple processes
+        for sentence transformers if n_jobs is specified."""
+        if not isinstance(self.encoder_, SentenceTransformer):
+            return np.asarray(self.encoder_.encode(documents))
+        n_jobs = self._effective_n_jobs()
+        use_pool = (
+            (n_jobs is not None)
+            and (n_jobs > 1)
+            and (len(documents) >= MULTI_PROCESS_THRESHOLD)
+            and (self.encoder_.device.type == "cpu")
+            # Subclasses with their own encode() method (e.g. E5Encoder)
+            # would be bypassed by the worker processes.
+            and (type(self.encoder_).encode is SentenceTransformer.encode)
+        )
+        if not use_pool:
+            return np.asarray(self.encoder_.encode(documents))
+        pool = self.encoder_.start_multi_process_pool(
+            target_devices=["cpu"] * n_jobs
+        )
+        try:
+            return self.encoder_.encode_multi_process(documents, pool)
+        finally:
+            self.encoder_.stop_multi_process_pool(pool)
+
+    def _effective_n_jobs(self) -> Optional[int]:
+        """Number of encoding processes, negative values of n_jobs
+        are interpreted the same way as in joblib."""
+        n_jobs = getattr(self, "n_jobs", None)
+        if n_jobs is None:
+            return None
+        if n_jobs == 0:
+            raise ValueError("n_jobs == 0 has no meaning.")
+        if n_jobs < 0:
+            n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+        return n_jobs
+
+    def _set_encoder_precision(self):
+        """Converts the sentence transformer to half precision
+        if it was requested and the encoder runs on a GPU."""
+        if not isinstance(self.encoder_, SentenceTransformer):
+            return
+        precision = getattr(self, "precision", "fp32")
+        if precision == "fp16" and self.encoder_.device.type == "cuda":
+            if next(self.encoder_.parameters()).dtype != torch.float16:
+                self.encoder_.half()
+
+    def _get_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """Returns the embedding cache of the model,
+        creates it on first use.
+        Returns None if no cache directory was specified,
+        or if the encoder's embeddings can't be cached reliably."""
+        cache_dir = getattr(self, "cache_dir", None)
+        if cache_dir is None:
+            return None
+        namespace = self._encoder_name()
+        if namespace is None:
+            return None
+        cache = getattr(self, "_embedding_cache", None)
+        if (
+            (cache is None)
+            or (cache.cache_dir != cache_dir)
+            or (cache.namespace != namespace)
+        ):
+            cache = EmbeddingCache(namespace, cache_dir=cache_dir)
+            self._embedding_cache = cache
+        return cache
+
+    def _encoder_name(self) -> Optional[str]:
+        """Name of the encoder used for namespacing cached embeddings.
+        Everything that changes the output of the encoder is included.
+        Returns None for encoders that can't be identified reliably."""
+        # Encoders with their own encode() method (e.g. E5Encoder or
+        # API-based encoders) can transform documents in ways
+        # that are not visible from the outside.
+        if not isinstance(self.encoder_, SentenceTransformer) or (
+            type(self.encoder_).encode is not SentenceTransformer.encode
+        ):
+            return None
+        try:
+            parts = [self.encoder_[0].auto_model.name_or_path]
+        except (AttributeError, IndexError, KeyError):
+            return None
+        prompt_name = getattr(self.encoder_, "default_prompt_name", None)
+        if prompt_name is not None:
+            prompt = self.encoder_.prompts.get(prompt_name, "")
+            parts.append(f"prompt-{EmbeddingCache.key(prompt)[:12]}")
+        max_seq_length = getattr(self.encoder_, "max_seq_length", None)
+        if max_seq_length is not None:
+            parts.append(f"len-{max_seq_length}")
+        truncate_dim = getattr(self.encoder_, "truncate_dim", None)
+        if truncate_dim is not None:
+            parts.append(f"dim-{truncate_dim}")
+        # Encoders can be shared between models, so the dtype is taken
+        # from the encoder itself instead of the model's precision.
+        dtype = next(self.encoder_.parameters()).dtype
+        if dtype != torch.float32:
+            parts.append(str(dtype).split(".")[-1])
+        return "_".join(parts)
 
     @abstractmethod
     def fit_transform(
@@ -476,6 +654,69 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
             classes = list(range(n_topics))
         return np.asarray(classes)
 
+    def _is_fitted(self) -> bool:
+        """Checks whether the model has been fitted."""
+        return getattr(self, "components_", None) is not None
+
+    def _remember_fit(
+        self,
+        raw_documents,
+        document_topic_matrix: np.ndarray,
+        document_term_matrix=None,
+    ):
+        """Stores the document-topic matrix inferred when fitting the model,
+        so that it can be reused for the same corpus later.
+        The document-term matrix is also stored if it was computed."""
+        self._last_fit = (raw_documents, document_topic_matrix)
+        if document_term_matrix is not None:
+            self._remember_document_terms(raw_documents, document_term_matrix)
+
+    def _remember_document_terms(self, corpus, document_term_matrix):
+        # The vocabulary is replaced whenever the vectorizer gets refitted,
+        # so we can tell whether the matrix is still valid.
+        vocabulary = getattr(self.vectorizer, "vocabulary_", None)
+        self._last_document_terms = (corpus, vocabulary, document_term_matrix)
+
+    def _document_term_matrix(self, corpus):
+        """Returns the document-term matrix of the corpus, reusing the last
+        one if it was computed for the same corpus and vocabulary."""
+        vocabulary = getattr(self.vectorizer, "vocabulary_", None)
+        last = getattr(self, "_last_document_terms", None)
+        if (last is not None) and (vocabulary is not None):
+            last_corpus, last_vocabulary, document_term_matrix = last
+            if (
+                (last_corpus is corpus)
+                and (last_vocabulary is vocabulary)
+                and (document_term_matrix.shape[0] == len(corpus))
+            ):
+                return document_term_matrix
+        document_term_matrix = self.vectorizer.transform(corpus)
+        self._remember_document_terms(corpus, document_term_matrix)
+        return document_term_matrix
+
+    def _fitted_document_topics(self, corpus) -> Optional[np.ndarray]:
+        """Returns the document-topic matrix from fitting if the model
+        was fitted on this exact corpus, otherwise None."""
+        last_fit = getattr(self, "_last_fit", None)
+        if last_fit is None:
+            return None
+        fit_corpus, document_topic_matrix = last_fit
+        if (fit_corpus is not corpus) or (
+            len(fit_corpus) != document_topic_matrix.shape[0]
+        ):
+            return None
+        return document_topic_matrix
+
+    def __getstate__(self):
+        # BaseEstimator may return the live __dict__ of the model,
+        # it has to be copied so that pickling doesn't modify the model.
+        state = dict(super().__getstate__())
+        # The training corpus should not be persisted with the model.
+        state.pop("_last_fit", None)
+        state.pop("_last_document_terms", None)
+        state.pop("_embedding_cache", None)
+        return state
+
     def prepare_topic_data(
         self,
         corpus: List[str],
@@ -498,15 +739,17 @@ class ContextualModel(ABC, TransformerMixin, BaseEstimator):
         """
         if embeddings is None:
             embeddings = self.encode_documents(corpus)
-        try:
-            document_topic_matrix = self.transform(
-                corpus, embeddings=embeddings
-            )
-        except (AttributeError, NotFittedError):
-            document_topic_matrix = self.fit_transform(
-                corpus, embeddings=embeddings
-            )
-        dtm = self.vectorizer.transform(corpus)  # type: ignore
+        document_topic_matrix = self._fitted_document_topics(corpus)
+        if document_topic_matrix is None:
+            if hasattr(self, "transform") and self._is_fitted():
+                document_topic_matrix = self.transform(
+                    corpus, embeddings=embeddings
+                )
+            else:
+                document_topic_matrix = self.fit_transform(
+                    corpus, embeddings=embeddings
+                )
+        dtm = self._document_term_matrix(corpus)
         res: TopicData = {
             "corpus": corpus,
             "document_term_matrix": dtm,
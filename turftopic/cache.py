@@ -0,0 +1,89 @@
+import hashlib
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """Content-addressed store for document embeddings.
+    Embeddings are optionally persisted to a directory,
+    so that they can be reused between sessions.
+    The most recently used embeddings are also kept in memory.
+
+    Parameters
+    ----------
+    namespace: str
+        Name of the encoder model, used to avoid collisions
+        between embeddings of different models.
+    cache_dir: str or Path, default None
+        Directory to save embeddings to.
+        If not specified, embeddings are only cached in memory.
+    max_size: int, default 4096
+        Maximal number of embeddings to keep in memory.
+        0 means that embeddings are not kept in memory.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size: int = 4096,
+    ):
+        self.namespace = namespace
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        if cache_dir is not None:
+            safe_name = re.sub(r"[^\w\-.]", "_", namespace)
+            self.path: Optional[Path] = Path(cache_dir).joinpath(safe_name)
+            self.path.mkdir(parents=True, exist_ok=True)
+        else:
+            self.path = None
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Produces a content hash for the given text."""
+        return hashlib.sha1(text.encode()).hexdigest()
+
+    def _remember(self, key: str, embedding: np.ndarray):
+        """Keeps embedding in memory, evicting the least recently used."""
+        if self.max_size <= 0:
+            return
+        self.embeddings[key] = embedding
+        self.embeddings.move_to_end(key)
+        while len(self.embeddings) > self.max_size:
+            self.embeddings.popitem(last=False)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Looks up an embedding, returns None if it's not in the cache."""
+        embedding = self.embeddings.get(key)
+        if embedding is not None:
+            self.embeddings.move_to_end(key)
+        elif self.path is not None:
+            file = self.path.joinpath(f"{key}.npy")
+            if file.exists():
+                embedding = np.load(file)
+                self._remember(key, embedding)
+        return embedding
+
+    def set(self, key: str, embedding: np.ndarray) -> np.ndarray:
+        """Adds an embedding to the cache and returns the stored array."""
+        embedding = np.asarray(embedding, dtype=np.float32)
+        self._remember(key, embedding)
+        if self.path is not None:
+            # Writing to a temporary file first, so that interrupted
+            # writes don't leave truncated files in the cache.
+            fd, tmp_file = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as out_file:
+                    np.save(out_file, embedding)
+                os.replace(tmp_file, self.path.joinpath(f"{key}.npy"))
+            except BaseException:
+                os.remove(tmp_file)
+                raise
+        return embedding
@@ -1,4 +1,5 @@
 from datetime import datetime
+from pathlib import Path
 from typing import Literal, Optional, Union
 
 import numpy as np
@@ -11,7 +12,7 @@ from sklearn.manifold import TSNE
 from sklearn.metrics.pairwise import cosine_distances
 from sklearn.preprocessing import label_binarize
 
-from turftopic.base import ContextualModel, Encoder
+from turftopic.base import ContextualModel, Encoder, precision_message
 from turftopic.dynamic import DynamicTopicModel
 from turftopic.feature_importance import (
     cluster_centroid_distance,
@@ -145,6 +146,23 @@ class ClusteringTopicModel(ContextualModel, ClusterMixin, DynamicTopicModel):
         is achieved similarly to Top2Vec.
     random_state: int, default None
         Random state to use so that results are exactly reproducible.
+    cache_dir: str or Path, default None
+        Directory to cache document embeddings in, so that they
+        can be reused between calls and sessions.
+        If not specified, embeddings are not cached.
+        Encoders with their own encode method (e.g. E5Encoder)
+        are never cached.
+    precision: 'fp32' or 'fp16', default 'fp32'
+        Floating point precision of sentence transformers
+        when encoding documents.
+        Half precision is only used when the encoder runs on a GPU.
+    n_jobs: int, default None
+        Number of processes to encode documents with on CPU.
+        -1 means using all processors, -2 all but one, and so on.
+        Only used for sentence transformers and corpora
+        of at least 5000 documents.
+        Worker processes are started with 'spawn', so scripts
+        have to be guarded with `if __name__ == "__main__":`.
     """
 
     def __init__(
@@ -163,9 +181,17 @@ class ClusteringTopicModel(ContextualModel, ClusterMixin, DynamicTopicModel):
             "agglomerative", "smallest"
         ] = "agglomerative",
         random_state: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        precision: Literal["fp32", "fp16"] = "fp32",
+        n_jobs: Optional[int] = None,
     ):
         self.encoder = encoder
         self.random_state = random_state
+        self.cache_dir = cache_dir
+        self.precision = precision
+        self.n_jobs = n_jobs
+        if precision not in ["fp32", "fp16"]:
+            raise ValueError(precision_message)
         if feature_importance not in ["c-tf-idf", "soft-c-tf-idf", "centroid"]:
             raise ValueError(feature_message)
         if isinstance(encoder, int):
@@ -282,7 +308,7 @@ class ClusteringTopicModel(ContextualModel, ClusterMixin, DynamicTopicModel):
         with console.status("Fitting model") as status:
             if embeddings is None:
                 status.update("Encoding documents")
-                embeddings = self.encoder_.encode(raw_documents)
+                embeddings = self.encode_documents(raw_documents)
                 console.log("Encoding done.")
             status.update("Extracting terms")
             self.doc_term_matrix = self.vectorizer.fit_transform(raw_documents)
@@ -326,7 +352,11 @@ class ClusteringTopicModel(ContextualModel, ClusterMixin, DynamicTopicModel):
         self, raw_documents, y=None, embeddings: Optional[np.ndarray] = None
     ):
         labels = self.fit_predict(raw_documents, y, embeddings)
-        return label_binarize(labels, classes=self.classes_)
+        document_topic_matrix = label_binarize(labels, classes=self.classes_)
+        self._remember_fit(
+            raw_documents, document_topic_matrix, self.doc_term_matrix
+        )
+        return document_topic_matrix
 
     def fit_transform_dynamic(
         self,
@@ -353,7 +383,7 @@ class ClusteringTopicModel(ContextualModel, ClusterMixin, DynamicTopicModel):
         )
         self.temporal_importance_ = np.zeros((n_bins, n_comp))
         if embeddings is None:
-            embeddings = self.encoder_.encode(raw_documents)
+            embeddings = self.encode_documents(raw_documents)
         for i_timebin in np.unique(time_labels):
             topic_importances = doc_topic_matrix[time_labels == i_timebin].sum(
                 axis=0
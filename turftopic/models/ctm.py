@@ -1,6 +1,7 @@
 import math
 import random
-from typing import Optional, Union
+from pathlib import Path
+from typing import Literal, Optional, Union
 
 import numpy as np
 import pyro
@@ -13,7 +14,7 @@ from rich.console import Console
 from sentence_transformers import SentenceTransformer
 from sklearn.feature_extraction.text import CountVectorizer
 
-from turftopic.base import ContextualModel, Encoder
+from turftopic.base import ContextualModel, Encoder, precision_message
 from turftopic.vectorizer import default_vectorizer
 
 
@@ -132,6 +133,23 @@ class AutoEncodingTopicModel(ContextualModel):
         Number of epochs to run during training.
     random_state: int, default None
         Random state to use so that results are exactly reproducible.
+    cache_dir: str or Path, default None
+        Directory to cache document embeddings in, so that they
+        can be reused between calls and sessions.
+        If not specified, embeddings are not cached.
+        Encoders with their own encode method (e.g. E5Encoder)
+        are never cached.
+    precision: 'fp32' or 'fp16', default 'fp32'
+        Floating point precision of sentence transformers
+        when encoding documents.
+        Half precision is only used when the encoder runs on a GPU.
+    n_jobs: int, default None
+        Number of processes to encode documents with on CPU.
+        -1 means using all processors, -2 all but one, and so on.
+        Only used for sentence transformers and corpora
+        of at least 5000 documents.
+        Worker processes are started with 'spawn', so scripts
+        have to be guarded with `if __name__ == "__main__":`.
     """
 
     def __init__(
@@ -148,9 +166,17 @@ class AutoEncodingTopicModel(ContextualModel):
         learning_rate: float = 1e-2,
         n_epochs: int = 50,
         random_state: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        precision: Literal["fp32", "fp16"] = "fp32",
+        n_jobs: Optional[int] = None,
     ):
         self.n_components = n_components
         self.random_state = random_state
+        self.cache_dir = cache_dir
+        self.precision = precision
+        self.n_jobs = n_jobs
+        if precision not in ["fp32", "fp16"]:
+            raise ValueError(precision_message)
         self.encoder = encoder
         if isinstance(encoder, str):
             self.encoder_ = SentenceTransformer(encoder)
@@ -185,7 +211,7 @@ class AutoEncodingTopicModel(ContextualModel):
             Document-topic matrix.
         """
         if embeddings is None:
-            embeddings = self.encoder_.encode(raw_documents)
+            embeddings = self.encode_documents(raw_documents)
         if self.combined:
             bow = self.vectorizer.fit_transform(raw_documents)
             contextual_embeddings = np.concatenate(
@@ -205,7 +231,7 @@ class AutoEncodingTopicModel(ContextualModel):
         with console.status("Fitting model") as status:
             if embeddings is None:
                 status.update("Encoding documents")
-                embeddings = self.encoder_.encode(raw_documents)
+                embeddings = self.encode_documents(raw_documents)
                 console.log("Documents encoded.")
             status.update("Extracting terms.")
             document_term_matrix = self.vectorizer.fit_transform(raw_documents)
@@ -276,6 +302,8 @@ class AutoEncodingTopicModel(ContextualModel):
     def fit_transform(
         self, raw_documents, y=None, embeddings: Optional[np.ndarray] = None
     ) -> np.ndarray:
-        return self.fit(raw_documents, y, embeddings).transform(
-            raw_documents, embeddings
-        )
+        document_topic_matrix = self.fit(
+            raw_documents, y, embeddings
+        ).transform(raw_documents, embeddings)
+        self._remember_fit(raw_documents, document_topic_matrix)
+        return document_topic_matrix
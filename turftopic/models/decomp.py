@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Literal, Optional, Union
 
 import numpy as np
@@ -8,7 +9,7 @@ from sklearn.decomposition import FastICA
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.metrics.pairwise import cosine_similarity, euclidean_distances
 
-from turftopic.base import ContextualModel, Encoder
+from turftopic.base import ContextualModel, Encoder, precision_message
 from turftopic.vectorizer import default_vectorizer
 
 
@@ -47,6 +48,23 @@ class SemanticSignalSeparation(ContextualModel):
         or their combination ('combined') should determine the word's importance for a topic.
     random_state: int, default None
         Random state to use so that results are exactly reproducible.
+    cache_dir: str or Path, default None
+        Directory to cache document embeddings in, so that they
+        can be reused between calls and sessions.
+        If not specified, embeddings are not cached.
+        Encoders with their own encode method (e.g. E5Encoder)
+        are never cached.
+    precision: 'fp32' or 'fp16', default 'fp32'
+        Floating point precision of sentence transformers
+        when encoding documents.
+        Half precision is only used when the encoder runs on a GPU.
+    n_jobs: int, default None
+        Number of processes to encode documents with on CPU.
+        -1 means using all processors, -2 all but one, and so on.
+        Only used for sentence transformers and corpora
+        of at least 5000 documents.
+        Worker processes are started with 'spawn', so scripts
+        have to be guarded with `if __name__ == "__main__":`.
     """
 
     def __init__(
@@ -62,6 +80,9 @@ class SemanticSignalSeparation(ContextualModel):
             "axial", "angular", "combined"
         ] = "combined",
         random_state: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        precision: Literal["fp32", "fp16"] = "fp32",
+        n_jobs: Optional[int] = None,
     ):
         self.n_components = n_components
         self.encoder = encoder
@@ -76,6 +97,11 @@ class SemanticSignalSeparation(ContextualModel):
             self.vectorizer = vectorizer
         self.max_iter = max_iter
         self.random_state = random_state
+        self.cache_dir = cache_dir
+        self.precision = precision
+        self.n_jobs = n_jobs
+        if precision not in ["fp32", "fp16"]:
+            raise ValueError(precision_message)
         if decomposition is None:
             self.decomposition = FastICA(
                 n_components, max_iter=max_iter, random_state=random_state
@@ -104,7 +130,7 @@ class SemanticSignalSeparation(ContextualModel):
         with console.status("Fitting model") as status:
             if embeddings is None:
                 status.update("Encoding documents")
-                embeddings = self.encoder_.encode(raw_documents)
+                embeddings = self.encode_documents(raw_documents)
                 console.log("Documents encoded.")
             status.update("Decomposing embeddings")
             doc_topic = self.decomposition.fit_transform(embeddings)
@@ -128,6 +154,7 @@ class SemanticSignalSeparation(ContextualModel):
                     * self.angular_components_
                 )
             console.log("Model fitting done.")
+        self._remember_fit(raw_documents, doc_topic)
         return doc_topic
 
     @property
@@ -159,7 +186,7 @@ class SemanticSignalSeparation(ContextualModel):
             Document-topic matrix.
         """
         if embeddings is None:
-            embeddings = self.encoder_.encode(raw_documents)
+            embeddings = self.encode_documents(raw_documents)
         return self.decomposition.transform(embeddings)
 
     def print_topics(
@@ -1,5 +1,6 @@
 import math
-from typing import Optional, Union
+from pathlib import Path
+from typing import Literal, Optional, Union
 
 import numpy as np
 import torch
@@ -7,7 +8,7 @@ from rich.console import Console
 from sentence_transformers import SentenceTransformer
 from sklearn.feature_extraction.text import CountVectorizer
 
-from turftopic.base import ContextualModel, Encoder
+from turftopic.base import ContextualModel, Encoder, precision_message
 from turftopic.models._fastopic import fastopic
 from turftopic.vectorizer import default_vectorizer
 
@@ -59,6 +60,23 @@ class FASTopic(ContextualModel):
         Learning rate for the ADAM optimizer.
     device: str, default "cpu"
         Device to run the model on. Defaults to CPU.
+    cache_dir: str or Path, default None
+        Directory to cache document embeddings in, so that they
+        can be reused between calls and sessions.
+        If not specified, embeddings are not cached.
+        Encoders with their own encode method (e.g. E5Encoder)
+        are never cached.
+    precision: 'fp32' or 'fp16', default 'fp32'
+        Floating point precision of sentence transformers
+        when encoding documents.
+        Half precision is only used when the encoder runs on a GPU.
+    n_jobs: int, default None
+        Number of processes to encode documents with on CPU.
+        -1 means using all processors, -2 all but one, and so on.
+        Only used for sentence transformers and corpora
+        of at least 5000 documents.
+        Worker processes are started with 'spawn', so scripts
+        have to be guarded with `if __name__ == "__main__":`.
     """
 
     def __init__(
@@ -76,10 +94,18 @@ class FASTopic(ContextualModel):
         n_epochs: int = 200,
         learning_rate: float = 0.002,
         device: str = "cpu",
+        cache_dir: Optional[Union[str, Path]] = None,
+        precision: Literal["fp32", "fp16"] = "fp32",
+        n_jobs: Optional[int] = None,
     ):
         self.n_components = n_components
         self.encoder = encoder
         self.random_state = random_state
+        self.cache_dir = cache_dir
+        self.precision = precision
+        self.n_jobs = n_jobs
+        if precision not in ["fp32", "fp16"]:
+            raise ValueError(precision_message)
         if isinstance(encoder, str):
             self.encoder_ = SentenceTransformer(encoder)
         else:
@@ -153,7 +179,7 @@ class FASTopic(ContextualModel):
         with console.status("Fitting model") as status:
             if embeddings is None:
                 status.update("Encoding documents")
-                embeddings = self.encoder_.encode(raw_documents)
+                embeddings = self.encode_documents(raw_documents)
                 console.log("Documents encoded.")
             self.train_doc_embeddings = embeddings
             status.update("Extracting terms.")
@@ -165,6 +191,9 @@ class FASTopic(ContextualModel):
             document_topic_matrix = self.transform(
                 raw_documents, embeddings=embeddings
             )
+        self._remember_fit(
+            raw_documents, document_topic_matrix, document_term_matrix
+        )
         return document_topic_matrix
 
     def transform(
@@ -185,7 +214,7 @@ class FASTopic(ContextualModel):
             Document-topic matrix.
         """
         if embeddings is None:
-            embeddings = self.encoder_.encode(raw_documents)
+            embeddings = self.encode_documents(raw_documents)
         with torch.no_grad():
             self.model.eval()
             theta = self.model.get_theta(
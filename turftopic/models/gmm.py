@@ -1,4 +1,5 @@
 from datetime import datetime
+from pathlib import Path
 from typing import Literal, Optional, Union
 
 import numpy as np
@@ -9,7 +10,7 @@ from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.mixture import BayesianGaussianMixture, GaussianMixture
 from sklearn.pipeline import Pipeline, make_pipeline
 
-from turftopic.base import ContextualModel, Encoder
+from turftopic.base import ContextualModel, Encoder, precision_message
 from turftopic.dynamic import DynamicTopicModel
 from turftopic.feature_importance import soft_ctf_idf
 from turftopic.vectorizer import default_vectorizer
@@ -56,6 +57,23 @@ class GMM(ContextualModel, DynamicTopicModel):
         memory load.
     random_state: int, default None
         Random state to use so that results are exactly reproducible.
+    cache_dir: str or Path, default None
+        Directory to cache document embeddings in, so that they
+        can be reused between calls and sessions.
+        If not specified, embeddings are not cached.
+        Encoders with their own encode method (e.g. E5Encoder)
+        are never cached.
+    precision: 'fp32' or 'fp16', default 'fp32'
+        Floating point precision of sentence transformers
+        when encoding documents.
+        Half precision is only used when the encoder runs on a GPU.
+    n_jobs: int, default None
+        Number of processes to encode documents with on CPU.
+        -1 means using all processors, -2 all but one, and so on.
+        Only used for sentence transformers and corpora
+        of at least 5000 documents.
+        Worker processes are started with 'spawn', so scripts
+        have to be guarded with `if __name__ == "__main__":`.
 
     Attributes
     ----------
@@ -74,12 +92,20 @@ class GMM(ContextualModel, DynamicTopicModel):
         weight_prior: Literal["dirichlet", "dirichlet_process", None] = None,
         gamma: Optional[float] = None,
         random_state: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        precision: Literal["fp32", "fp16"] = "fp32",
+        n_jobs: Optional[int] = None,
     ):
         self.n_components = n_components
         self.encoder = encoder
         self.weight_prior = weight_prior
         self.gamma = gamma
         self.random_state = random_state
+        self.cache_dir = cache_dir
+        self.precision = precision
+        self.n_jobs = n_jobs
+        if precision not in ["fp32", "fp16"]:
+            raise ValueError(precision_message)
         if isinstance(encoder, str):
             self.encoder_ = SentenceTransformer(encoder)
         else:
@@ -116,7 +142,7 @@ class GMM(ContextualModel, DynamicTopicModel):
         with console.status("Fitting model") as status:
             if embeddings is None:
                 status.update("Encoding documents")
-                embeddings = self.encoder_.encode(raw_documents)
+                embeddings = self.encode_documents(raw_documents)
                 console.log("Documents encoded.")
             status.update("Extracting terms.")
             document_term_matrix = self.vectorizer.fit_transform(raw_documents)
@@ -130,6 +156,9 @@ class GMM(ContextualModel, DynamicTopicModel):
                 document_topic_matrix, document_term_matrix
             )
             console.log("Model fitting done.")
+        self._remember_fit(
+            raw_documents, document_topic_matrix, document_term_matrix
+        )
         return document_topic_matrix
 
     @property
@@ -158,7 +187,7 @@ class GMM(ContextualModel, DynamicTopicModel):
             Document-topic matrix.
         """
         if embeddings is None:
-            embeddings = self.encoder_.encode(raw_documents)
+            embeddings = self.encode_documents(raw_documents)
         return self.gmm_.predict_proba(embeddings)
 
     def fit_transform_dynamic(
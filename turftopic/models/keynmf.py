@@ -1,6 +1,7 @@
 import warnings
 from datetime import datetime
-from typing import Optional, Union
+from pathlib import Path
+from typing import Literal, Optional, Union
 
 import numpy as np
 import scipy.sparse as spr
@@ -10,7 +11,7 @@ from sklearn.exceptions import NotFittedError
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.preprocessing import normalize
 
-from turftopic.base import ContextualModel, Encoder
+from turftopic.base import ContextualModel, Encoder, precision_message
 from turftopic.data import TopicData
 from turftopic.dynamic import DynamicTopicModel
 from turftopic.hierarchical import TopicNode
@@ -47,6 +48,23 @@ class KeyNMF(ContextualModel, DynamicTopicModel):
         Number of keywords to extract for each document.
     random_state: int, default None
         Random state to use so that results are exactly reproducible.
+    cache_dir: str or Path, default None
+        Directory to cache document embeddings in, so that they
+        can be reused between calls and sessions.
+        If not specified, embeddings are not cached.
+        Encoders with their own encode method (e.g. E5Encoder)
+        are never cached.
+    precision: 'fp32' or 'fp16', default 'fp32'
+        Floating point precision of sentence transformers
+        when encoding documents.
+        Half precision is only used when the encoder runs on a GPU.
+    n_jobs: int, default None
+        Number of processes to encode documents with on CPU.
+        -1 means using all processors, -2 all but one, and so on.
+        Only used for sentence transformers and corpora
+        of at least 5000 documents.
+        Worker processes are started with 'spawn', so scripts
+        have to be guarded with `if __name__ == "__main__":`.
     """
 
     def __init__(
@@ -58,8 +76,16 @@ class KeyNMF(ContextualModel, DynamicTopicModel):
         vectorizer: Optional[CountVectorizer] = None,
         top_n: int = 25,
         random_state: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        precision: Literal["fp32", "fp16"] = "fp32",
+        n_jobs: Optional[int] = None,
     ):
         self.random_state = random_state
+        self.cache_dir = cache_dir
+        self.precision = precision
+        self.n_jobs = n_jobs
+        if precision not in ["fp32", "fp16"]:
+            raise ValueError(precision_message)
         self.n_components = n_components
         self.top_n = top_n
         self.encoder = encoder
@@ -95,6 +121,8 @@ class KeyNMF(ContextualModel, DynamicTopicModel):
         """
         if isinstance(batch_or_document, str):
             batch_or_document = [batch_or_document]
+        if (embeddings is None) and len(batch_or_document):
+            embeddings = self.encode_documents(batch_or_document)
         return self.extractor.batch_extract_keywords(
             batch_or_document, embeddings=embeddings
         )
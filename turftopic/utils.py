@@ -1,42 +1,44 @@
 import csv
 import io
+from typing import Iterable
 
 
 def export_table(
-    table: list[list[str]],
+    table: Iterable[list[str]],
     format="csv",
 ) -> str:
+    """Exports a table to a string in the given format.
+    The first row of the table is interpreted as the column names.
+    Rows can be supplied lazily, they are written one by one."""
+    if format not in ["csv", "latex", "markdown"]:
+        raise ValueError(
+            f"Format '{format}' not supported for tables, please use 'markdown', 'latex' or 'csv'"
+        )
+    rows = iter(table)
+    columns = next(rows)
+    output = io.StringIO()
     if format == "csv":
-        output = io.StringIO()
         writer = csv.writer(output, quoting=csv.QUOTE_NONNUMERIC)
-        for row in table:
+        writer.writerow(columns)
+        for row in rows:
             writer.writerow(row)
         return output.getvalue()
     if format == "latex":
-        columns, *rows = table
         n_columns = len(columns)
         latex_column_format = " ".join(["l"] * n_columns)
-        latex_columns = " & ".join(columns) + "\\\\"
-        latex_rows = [" & ".join(row) + "\\\\" for row in rows]
-        latex_table = [
-            "\\begin{center}",
-            f"\\begin{{tabular}}{{ {latex_column_format} }}",
-            latex_columns,
-            "\\hline",
-            *latex_rows,
-            "\\end{tabular}",
-            "\\end{center}",
-        ]
-        return "\n".join(latex_table)
-    if format == "markdown":
-        columns, *rows = table
-        n_columns = len(columns)
-        separator = ["-"] * n_columns
-        markdown_rows = [
-            "|" + "|".join([" " + value + " " for value in row]) + "|"
-            for row in [columns, separator, *rows]
-        ]
-        return "\n".join(markdown_rows)
-    raise ValueError(
-        f"Format '{format}' not supported for tables, please use 'markdown', 'latex' or 'csv'"
-    )
+        output.write("\\begin{center}\n")
+        output.write(f"\\begin{{tabular}}{{ {latex_column_format} }}\n")
+        output.write(" & ".join(columns) + "\\\\\n")
+        output.write("\\hline\n")
+        for row in rows:
+            output.write(" & ".join(row) + "\\\\\n")
+        output.write("\\end{tabular}\n")
+        output.write("\\end{center}")
+        return output.getvalue()
+    n_columns = len(columns)
+    separator = ["-"] * n_columns
+    output.write("|" + "|".join(f" {value} " for value in columns) + "|")
+    output.write("\n|" + "|".join(f" {value} " for value in separator) + "|")
+    for row in rows:
+        output.write("\n|" + "|".join(f" {value} " for value in row) + "|")
+    return output.getvalue()